@@ -23,12 +23,11 @@ The standard `getpass` function can also be used if the `stream`
 parameter is set to `sys.stdout`.
 """
 
-from itertools import cycle
-from threading import Thread
-from typing import Literal
-from time import sleep
+from threading import Thread, Event
+from typing import Literal, Optional
 from shutil import get_terminal_size
-import sys, io
+from time import monotonic
+import sys, io, os
 
 COLORS = {
     "white": "",
@@ -44,6 +43,18 @@ BOLD = "\033[1m"
 ENDC = "\033[0m"
 
 STDOUT = sys.__stdout__
+_IS_TTY = STDOUT is not None and STDOUT.isatty()
+_ENCODING = STDOUT.encoding if STDOUT is not None else "utf-8"
+# Writing straight to the descriptor would skip the UTF-8 handling of the
+# Windows console, so that only gets done elsewhere
+_STDOUT_FD = STDOUT.fileno() if _IS_TTY and os.name != "nt" else None
+
+# Cached terminal width (and the bytes for clearing a line), along with
+# how long to go before checking the width again
+_COLS_TTL = 1.0
+_N_COLS = 0
+_CLEAR_BYTES = b"\r"
+_cols_refreshed = 0.0
 
 INLINE = "INLINE"
 NEWLINE = "NEWLINE"
@@ -66,10 +77,10 @@ def input(prompt = ""):
     Loaders with `print_mode=NEWLINE` will behave like
     INLINE loaders while input is being read.
     """
-    import tty, sys, termios
+    import tty, sys, termios, codecs
 
     # Set __user_input__ to True
-    global __user_input__, _active_loader
+    global __user_input__
     __user_input__ = True
     
     # Print the prompt
@@ -82,19 +93,42 @@ def input(prompt = ""):
     old = termios.tcgetattr(fd)
     tty.setcbreak(fd)
 
-    # Read and display input characters
+    # Read and display input characters. Whatever is available gets read
+    # (and echoed) at once so pasted text doesn't take a read per character.
+    # Nothing past the end of the line is consumed, so anything typed after
+    # it stays in sys.stdin for whatever reads from it next.
+    stdin = sys.stdin.buffer
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")("replace")
     input_chars = []
-    while True:
-        char = sys.stdin.read(1)
-        if char in ["\n", "\r"]:
+    done = False
+    while not done:
+        data = stdin.peek(1)
+        if not data:
             break
-        elif char in ["\b", "\x7f"]:
-            if input_chars: 
-                input_chars.pop()
-                print("\b \b", end="", flush=True)
-        else:
-            input_chars.append(char)
-            print(char, end="", flush=True)
+        ends = [i for i in (data.find(b"\n"), data.find(b"\r")) if i != -1]
+        if ends:
+            data = data[:min(ends) + 1]
+            done = True
+        stdin.read(len(data))
+
+        # A newline byte can't be part of a multi-byte character, so the
+        # decoder never holds on to anything once the line is finished
+        chunk = decoder.decode(data, final=done)
+
+        echo = []
+        for char in chunk:
+            if char in ["\n", "\r"]:
+                break
+            elif char in ["\b", "\x7f"]:
+                if input_chars: 
+                    input_chars.pop()
+                    echo.append("\b \b")
+            else:
+                input_chars.append(char)
+                echo.append(char)
+
+        if echo:
+            print("".join(echo), end="", flush=True)
 
     # Reset the terminal
     termios.tcsetattr(fd, termios.TCSADRAIN, old)
@@ -105,7 +139,7 @@ def input(prompt = ""):
 
     # Set __user_input__ back to False and wait for the active loader to go to its next step
     __user_input__ = False
-    if isinstance(_active_loader, _BaseLoader): sleep(_active_loader._steptime)
+    if isinstance(_active_loader, _BaseLoader): _active_loader._wait_for_frame()
 
     return "".join(input_chars)
 
@@ -130,16 +164,49 @@ def getpass(prompt = "Password: "):
 
     # Set __user_input__ back to False and wait for the active loader to go to its next step
     __user_input__ = False
-    if isinstance(_active_loader, _BaseLoader): sleep(_active_loader._steptime)
+    if isinstance(_active_loader, _BaseLoader): _active_loader._wait_for_frame()
 
     return password 
 
+def _write(data: bytes):
+    """
+    Write raw bytes to the terminal and flush them in a single call.
+
+    When stdout is a terminal (other than a Windows console), the
+    bytes go straight to its file descriptor, skipping the locking
+    and buffering of `sys.stdout`.
+    """
+    if _STDOUT_FD is None:
+        buffer = STDOUT.buffer
+        buffer.write(data)
+        buffer.flush()
+        return
+
+    # os.write can write less than it was given
+    view = memoryview(data)
+    while view:
+        view = view[os.write(_STDOUT_FD, view):]
+
+def _refresh_cols():
+    """
+    Update the cached terminal width used for clearing lines.
+    """
+    global _N_COLS, _CLEAR_BYTES, _cols_refreshed
+    _N_COLS = get_terminal_size().columns
+    _CLEAR_BYTES = b"\r" + b" " * _N_COLS
+    _cols_refreshed = monotonic()
+
 def _clear_line():
     """
     Clear out the current terminal line.
     """
-    n_cols = get_terminal_size().columns
-    print("\r" + " " * n_cols, flush=True, end="", file=STDOUT)
+    # Querying the terminal size is a syscall, so the width is only
+    # checked again once the cached value is a little while old
+    if monotonic() - _cols_refreshed > _COLS_TTL:
+        _refresh_cols()
+    _write(_CLEAR_BYTES)
+
+_refresh_cols()
 
 
 class _BaseLoader:
@@ -176,10 +243,17 @@ class _BaseLoader:
         self._print_mode = print_mode
         assert print_mode in [INLINE, NEWLINE], f"Unrecognized print_mode: {print_mode}"
 
-        self._thread: Thread = Thread(target=self._animate, daemon=True)
-        self._done = False
+        # Loaders whose steps are all the same never visibly change, so they
+        # only need an animation thread once something gets printed
+        self._static = len(set(self._steps)) == 1
+        self._thread: Optional[Thread] = None
+        self._stop_event = Event()
+        self._frame_event = Event()
+        self._prev_bytes = None
+        self._last_capture_pos = 0
         self._error_in_process = False
         self._formatter = _MsgFormatter(print_mode)
+        self._build_frames()
 
     def __enter__(self):
         self.start()
@@ -196,9 +270,41 @@ class _BaseLoader:
         # Set the active loader
         global _active_loader
         _active_loader = self
+        self._error_in_process = False
+        self._formatter = _MsgFormatter(self._print_mode)
 
-        self._printed_msg = io.StringIO()
+        # Redirected output doesn't benefit from an animation, so
+        # just print the loading message
+        if not _IS_TTY:
+            print(self._loading_msg, flush=True, file=STDOUT)
+            return
+
+        _refresh_cols()
+        self._last_capture_pos = 0
+
+        self._printed_msg = _CaptureStream()
         sys.stdout = self._printed_msg
+        self._prev_bytes = None
+        self._stop_event.clear()
+
+        # A single-frame loader only needs to be drawn once until something
+        # gets printed, at which point the animation takes over displaying it
+        if self._static:
+            _write(self._encoded_frames[0])
+            self._printed_msg._on_first_write = self._start_thread
+        else:
+            self._start_thread()
+
+    def _start_thread(self):
+        """
+        Start the animation thread for the current run.
+        """
+        # A thread can only be started once, so each run gets a new one (this
+        # lets the loader be started again, e.g., each time a wrapped function
+        # gets called)
+        if self._stop_event.is_set() or self._thread is not None:
+            return
+        self._thread = Thread(target=self._animate, daemon=True)
         self._thread.start()
 
     def stop(self):
@@ -209,8 +315,17 @@ class _BaseLoader:
         global _active_loader
         _active_loader = None
 
+        if not _IS_TTY:
+            if not self._error_in_process:
+                print(self._finished_msg, flush=True, file=STDOUT)
+            return
+
         # Stop the loader and reset STDOUT
-        self._done = True
+        self._printed_msg._on_first_write = None
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
         sys.stdout = STDOUT
 
         # Print the finished message
@@ -222,20 +337,86 @@ class _BaseLoader:
 
     def update_msg(self, new_msg: str):
         self._loading_msg = new_msg
+        self._build_frames()
+        if not _IS_TTY:
+            if _active_loader is self:
+                print(new_msg, flush=True, file=STDOUT)
+            return
         _clear_line()
+        self._prev_bytes = None
+        self._last_capture_pos = None
+
+        # Without an animation thread running, nothing else will redraw the loader
+        if _active_loader is self and self._thread is None:
+            _write(self._encoded_frames[0])
+
+    def _build_frames(self):
+        """
+        Precompute the encoded loader message for each step of the animation.
+        """
+        self._encoded_frames = tuple(
+            f"\r{self._format_step(s)}".encode(_ENCODING, "replace")
+            for s in self._steps
+        )
+
+    def _format_step(self, current_symbol):
+        symbol = f"{self._color}{BOLD}{current_symbol}{ENDC}"
+        return f"{symbol} {self._loading_msg}"
 
     def _animate(self):
-        for x in cycle(self._steps):
-            if self._done:
-                break
-            print(f"\r{self._get_msg(x)}", flush=True, end="", file=STDOUT)
-            sleep(self._steptime)
+        # Bind everything used on each frame up front
+        get_msg_bytes = self._get_msg_bytes
+        stopped = self._stop_event.is_set
+        wait = self._stop_event.wait
+        frame_drawn = self._frame_event.set
+        steptime = self._steptime
+        n_steps = len(self._encoded_frames)
+
+        step = 0
+        while not stopped():
+            # Skip the write when the frame wouldn't change anything
+            frame = get_msg_bytes(step)
+            if frame != self._prev_bytes:
+                _write(frame)
+                self._prev_bytes = frame
+            step = (step + 1) % n_steps
+            frame_drawn()
+
+            # Waiting on the event (rather than sleeping) lets stop()
+            # wake the animation up right away
+            wait(steptime)
+
+    def _wait_for_frame(self):
+        """
+        Wait for the animation to draw its next frame.
+        """
+        if not _IS_TTY:
+            return
+
+        # Make sure the printed output gets formatted again now that the
+        # input is finished
+        self._last_capture_pos = None
+        if self._thread is not None and self._thread.is_alive():
+            self._frame_event.clear()
+            self._frame_event.wait(self._steptime)
 
     def _get_msg(self, current_symbol):
-        symbol = f"{self._color}{BOLD}{current_symbol}{ENDC}"
-        loader_msg = f"{symbol} {self._loading_msg}"          
+        loader_msg = self._format_step(current_symbol)
         return self._formatter.format(loader_msg, self._printed_msg)
 
+    def _get_msg_bytes(self, step):
+        # Nothing new has been printed since the last frame, so the precomputed
+        # frame can be used as is (anything printed before is still on screen)
+        pos = self._printed_msg.tell()
+        if pos == self._last_capture_pos:
+            return self._encoded_frames[step]
+        self._last_capture_pos = pos
+
+        # Formatting may clear the line, so this frame always gets drawn
+        frame = f"\r{self._get_msg(self._steps[step])}"
+        self._prev_bytes = None
+        return frame.encode(_ENCODING, "replace")
+
     @classmethod
     def wrap(cls, loading_msg: str = "Loading...", finished_msg: str = "Done!",
              steptime = 0.1, color = "white", print_mode: _PRINT_MODES = INLINE):
@@ -282,10 +463,10 @@ class _MsgFormatter:
     """
 
     def __init__(self, print_mode: _PRINT_MODES):
-        self._print_mode = print_mode
-        self._printed_lines = []
+        self._inline = print_mode == INLINE
+        self._last_seen = None
 
-    def format(self, loader_msg: str, stdio: io.StringIO):
+    def format(self, loader_msg: str, stdio: "_CaptureStream"):
         """
         Format the loader message and any printed statements for
         display based on the current printing mode ("INLINE" or 
@@ -296,9 +477,9 @@ class _MsgFormatter:
         ----------
         loader_msg : str
             The current symbol and loading message for the loader.
-        stdio : io.StringIO
-            The StringIO object that sys.stdout has been pointed
-            to for capturing printed strings.
+        stdio : _CaptureStream
+            The stream that sys.stdout has been pointed to for
+            capturing printed strings.
 
         Returns
         -------
@@ -309,41 +490,94 @@ class _MsgFormatter:
         
         if not printed_msg is None:
             _clear_line()
-            if self._print_mode == INLINE or __user_input__:
+            if self._inline or __user_input__:
                 return f"{loader_msg} {printed_msg}"
             return f"{printed_msg}\n{loader_msg}"
         
         return loader_msg
 
-    def _get_printed_msg(self, stdio: io.StringIO):
+    def _get_printed_msg(self, stdio: "_CaptureStream"):
         """
         Gets the printed message to be displayed (if there is one).
         """
-        global INLINE
-        if stdio.getvalue():
-            printed_lines = stdio.getvalue().strip("\n").split("\n")
-            last_printed = printed_lines[-1]
-
-            # For INLINE printing you always just want whatever was last printed
-            if self._print_mode == INLINE or __user_input__:
-                return last_printed
-            
-            # For NEWLINE printing you just want to send back a line the first time
-            # it gets seen (otherwise you keep printing a ton of new lines)
-            last_seen = self._printed_lines[-1] if len(self._printed_lines) > 0 else None
-            if last_printed != last_seen:
-                
-                # Update the seen lines
-                if len(printed_lines) == len(self._printed_lines):
-                    self._printed_lines[-1] = last_printed
-                else:
-                    self._printed_lines.append(last_printed)
-
-                return last_printed
+        last_printed = stdio._last
+        if last_printed is None:
+            return
+
+        # For INLINE printing you always just want whatever was last printed
+        if self._inline or __user_input__:
+            return last_printed
+        
+        # For NEWLINE printing you just want to send back a line the first time
+        # it gets seen (otherwise you keep printing a ton of new lines)
+        if last_printed != self._last_seen:
+            self._last_seen = last_printed
+            return last_printed
             
         return
 
 
+class _CaptureStream(io.TextIOBase):
+    """
+    A write-only text stream for capturing things printed while a
+    loader is running.
+
+    Nothing is passed through to the terminal and only the last
+    non-empty line is kept since that is all the loaders ever
+    display. The stream the output would have gone to is kept
+    around for things like `encoding` and `fileno`. If
+    `on_first_write` is given, it gets called the first time
+    something is written.
+    """
+
+    def __init__(self, original = STDOUT, on_first_write = None):
+        super().__init__()
+        self._original = original
+        self._on_first_write = on_first_write
+        self._last = None
+        self._partial = ""
+        self._pos = 0
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._pos
+
+    @property
+    def encoding(self):
+        return self._original.encoding
+
+    @property
+    def errors(self):
+        return self._original.errors
+
+    def fileno(self):
+        return self._original.fileno()
+
+    def write(self, s: str):
+        # Anything after the last newline is an unfinished line that
+        # later writes can add on to
+        head, newline, tail = s.rpartition("\n")
+        if newline:
+            last = tail or (self._partial + head).rstrip("\n").rpartition("\n")[2]
+            self._partial = tail
+        else:
+            self._partial += s
+            last = self._partial
+        if last:
+            self._last = last
+
+        # Only move the position once the last line is up to date, since the
+        # animation uses it to tell when there is something new to show
+        self._pos += len(s)
+
+        callback, self._on_first_write = self._on_first_write, None
+        if callback is not None:
+            callback()
+        return len(s)
+
+
 class SpinLoader(_BaseLoader):
     """
     A basic spinning bar loader.